@@ -1,13 +1,16 @@
 import argparse
 import curses
 import os
-from typing import List
+from typing import Dict, List, Set, Tuple
 from context_curse.thing import Thing
 
 
 def parse_arguments():
     parser = argparse.ArgumentParser(
-        description="Thank you for checking out Context Curse...\n a CLI tool for managing files and directories before feeding them into a LLM with a limited context window.")
+        description="Thank you for checking out Context Curse...\n a CLI tool for managing files and directories before feeding them into a LLM with a limited context window.",
+        fromfile_prefix_chars='@')  # "@args.txt" reads more arguments from a file, one per line
+    parser.add_argument('-r', '--root-path', type=str, default='.',
+                        help='Directory to browse (default: current directory).')
     parser.add_argument('-e', '--extensions', type=str,
                         help='Comma-separated extensions to keep (e.g., "py,txt").')
     parser.add_argument('-i', '--input', type=str,
@@ -17,95 +20,141 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def load_input_preferences(input_path: str) -> List[str]:
+def load_input_preferences(input_path: str) -> Set[str]:
     '''should be a file with a list of paths to keep, one per line.'''
+    # Read line by line into a set: apply_input_preferences tests membership for every visited Thing
     with open(input_path, 'r', encoding='utf-8') as f:
-        return [line.strip() for line in f.readlines()]
+        return {path for path in (line.strip() for line in f) if path}
+
+
+_INDENTS = ['']
+
+
+def get_indent(depth: int) -> str:
+    """Return the indentation for a tree depth, reusing one string per depth."""
+    while len(_INDENTS) <= depth:
+        _INDENTS.append(_INDENTS[-1] + '    ')
+    return _INDENTS[depth]
 
 
 def curses_app(stdscr: 'curses.window', root: Thing, output_path: str):
     curses.curs_set(0)
     selected_index = 0
-    expanded_dirs = set()  # Track which directories are expanded
-    page_size = 10
+    # Track which directories are expanded; Things hash by identity, not by path
+    expanded_dirs: Set[Thing] = set()
+    page_size = 10  # Most item rows to show; render() shrinks it to fit the terminal
+
+    visible_cache: List[Thing] = None  # Rebuilt only after expand/collapse
+
+    def invalidate_visible_things():
+        nonlocal visible_cache
+        visible_cache = None
 
     def get_visible_things() -> List[Thing]:
         """Get a list of visible things based on the expanded state."""
+        nonlocal visible_cache
+        if visible_cache is not None:
+            return visible_cache
         visible = []
-
-        def add_visible_children(thing: Thing, depth: int):
-            visible.append((thing, depth))
-            if thing.get_path() in expanded_dirs and thing.is_directory():
-                for child in thing.get_children():
-                    add_visible_children(child, depth + 1)
-
-        add_visible_children(root, 0)
+        append = visible.append
+        expanded = expanded_dirs
+
+        # Explicit stack instead of recursion; children are pushed reversed to keep their order
+        stack = [(root, 0)]
+        while stack:
+            thing, depth = stack.pop()
+            append((thing, depth))
+            if thing in expanded and thing.is_directory():
+                stack.extend((child, depth + 1)
+                             for child in reversed(thing.get_children()))
+
+        visible_cache = visible
         return visible
 
+    full_redraw = True  # Clear and repaint everything on the next render
+    drawn_rows = {}  # Screen row -> (text, color) as it was last drawn
+    # Thing -> (label, selected label); a Thing's depth never changes
+    row_labels: Dict[Thing, Tuple[str, str]] = {}
+
+    # Add tool description and commands at the top
+    tool_description = (
+        "#####################\n"
+        "Context Curse - Manage your files and directories before feeding into an LLM\n"
+        "  Commands:\n"
+        "    ↑/↓: Navigate\n"
+        "    Enter: Select/Deselect\n"
+        "    Space: Expand/Collapse\n"
+        "    s: Save selections\n"
+        "    q: Quit\n"
+        "  Legend:\n"
+        "    >: Selected\n"
+        "    \\: Directory\n"
+        "    Green: Kept\n"
+        "    Yellow: Mixed\n"
+        "    White: Not kept\n"
+        "#####################\n"
+    )
+
+    current_color = None  # Color pair currently set on stdscr
+
+    def set_color(c: int):
+        """Switch the drawing color, skipping the call if it is already active."""
+        nonlocal current_color
+        if c != current_color:
+            stdscr.attrset(color_pairs[c])
+            current_color = c
+
+    def render_row(row: int, text: str, c: int):
+        """Overwrite a single screen row."""
+        stdscr.move(row, 0)
+        stdscr.clrtoeol()
+        set_color(c)
+        stdscr.addstr(row, 0, text)
+
     def render():
-        stdscr.clear()
+        nonlocal full_redraw
+        if full_redraw:
+            stdscr.clear()
+            drawn_rows.clear()
 
-        # Add tool description and commands at the top
-        tool_description = (
-            "#####################\n"
-            "Context Curse - Manage your files and directories before feeding into an LLM\n"
-            "  Commands:\n"
-            "    ↑/↓: Navigate\n"
-            "    Enter: Select/Deselect\n"
-            "    Space: Expand/Collapse\n"
-            "    s: Save selections\n"
-            "    q: Quit\n"
-            "  Legend:\n"
-            "    >: Selected\n"
-            "    \\: Directory\n"
-            "    Green: Kept\n"
-            "    Yellow: Mixed\n"
-            "    White: Not kept\n"
-            "#####################\n"
-        )
-
-        # Draw tool description in cyan/blue
-        stdscr.attron(curses.color_pair(7))  # Cyan/Blue color pair
-        stdscr.addstr(0, 0, tool_description)
-        stdscr.attroff(curses.color_pair(7))
+            # Draw tool description in cyan/blue
+            set_color(7)  # Cyan/Blue color pair
+            stdscr.addstr(0, 0, tool_description)
+            full_redraw = False
 
         things_to_display: List[Thing] = get_visible_things()
         num_items = len(things_to_display)
 
-        # Determine the range of items to display
-        start_index = max(0, selected_index - page_size // 2)
-        end_index = min(num_items, start_index + page_size)
-
         # Calculate the index offset for the top indicator
         tool_description_lines = len(tool_description.split('\n'))
         indicator_line_index = tool_description_lines
 
+        # Only lay out rows that fit between the two scroll indicators, so
+        # nothing is formatted or drawn past the bottom of the terminal
+        height, width = stdscr.getmaxyx()
+        visible_rows = max(
+            0, min(page_size, height - indicator_line_index - 2))
+
+        # Determine the range of items to display
+        start_index = max(0, selected_index - visible_rows // 2)
+        end_index = min(num_items, start_index + visible_rows)
+
+        rows = {}
+
         # Add scroll indicators if needed
-        if num_items > page_size:
+        if num_items > visible_rows:
             # Add "..." at the top if there are items above the visible range
             if start_index > 0:
-                stdscr.addstr(indicator_line_index, 0,
-                              "...", curses.color_pair(7))
+                rows[indicator_line_index] = ("...", 7)
             # Add "..." at the bottom if there are items below the visible range
             if end_index < num_items:
-                stdscr.addstr(curses.LINES - 1, 0, "...", curses.color_pair(7))
+                rows[height - 1] = ("...", 7)
 
-        # Display the visible items
+        # Lay out the visible items
         for idx, (thing, depth) in enumerate(things_to_display[start_index:end_index]):
             display_idx = idx + indicator_line_index + \
                 (1 if start_index > 0 else 0)
 
-            # Highlight the selected item
-            if idx + start_index == selected_index:
-                mark = ">"
-            else:
-                mark = ""
-
-            if thing.is_directory():
-                suffix = "\\"
-            else:
-                suffix = ""
-
             if thing.get_keep() and thing.get_children_keep():
                 c = 2
             elif thing.get_keep() is None:
@@ -113,14 +162,32 @@ def curses_app(stdscr: 'curses.window', root: Thing, output_path: str):
             else:
                 c = 1
 
-            color_pair = curses.color_pair(c)
-            stdscr.attron(color_pair)
-            # Add indentation based on the depth
-            stdscr.addstr(
-                display_idx, 0, f"{mark}{'    ' * depth}{thing.get_path()}{suffix}")
-            stdscr.attroff(color_pair)
-
-        stdscr.refresh()
+            labels = row_labels.get(thing)
+            if labels is None:
+                if thing.is_directory():
+                    suffix = "\\"
+                else:
+                    suffix = ""
+                # Add indentation based on the depth
+                label = f"{get_indent(depth)}{thing.get_path()}{suffix}"
+                labels = row_labels[thing] = (label, ">" + label)
+
+            # Highlight the selected item; clip so long paths don't wrap
+            rows[display_idx] = (
+                labels[idx + start_index == selected_index][:width - 1], c)
+
+        # Only touch rows whose text or color differs from the last frame
+        for row in drawn_rows.keys() - rows.keys():
+            stdscr.move(row, 0)
+            stdscr.clrtoeol()
+            del drawn_rows[row]
+        for row, line in rows.items():
+            if drawn_rows.get(row) != line:
+                drawn_rows[row] = line
+                render_row(row, *line)
+
+        # Flushed to the terminal by a single curses.doupdate() per keypress
+        stdscr.noutrefresh()
 
     curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Default
     curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)  # Kept
@@ -133,9 +200,14 @@ def curses_app(stdscr: 'curses.window', root: Thing, output_path: str):
                      curses.COLOR_WHITE)  # Selected, mixed
     # Cyan/Blue for tool_description
     curses.init_pair(7, curses.COLOR_CYAN, curses.COLOR_BLACK)
+    # Attribute values for pairs 0-7, looked up once instead of per row
+    color_pairs = tuple(curses.color_pair(i) for i in range(8))
 
     def confirm_action(action: str) -> bool:
+        nonlocal full_redraw
+        full_redraw = True
         stdscr.clear()
+        set_color(0)
         stdscr.addstr(0, 0, f"Are you sure you want to {action}? (y/n)")
         stdscr.refresh()
         while True:
@@ -145,89 +217,108 @@ def curses_app(stdscr: 'curses.window', root: Thing, output_path: str):
             elif key == ord('n'):
                 return False
 
+    needs_render = True  # Set by handlers that change what is on screen
     while True:
         things_to_display: List[Thing] = get_visible_things()
-        num_items = len(things_to_display)
-        # Ensure start_index and end_index are valid
-        start_index = max(0, selected_index - page_size // 2)
-        end_index = min(num_items, start_index + page_size)
 
-        try:
-            render()
-        except curses.error:
-            pass
+        # The visible window is derived from selected_index inside render()
+        if needs_render:
+            try:
+                render()
+            except curses.error:
+                pass
+            curses.doupdate()
+            needs_render = False
 
         key = stdscr.getch()
 
         if key == curses.KEY_UP:
             if selected_index > 0:
                 selected_index -= 1
-                if selected_index < start_index:
-                    start_index = max(0, selected_index - page_size // 2)
-                    end_index = min(num_items, start_index + page_size)
+                needs_render = True
         elif key == curses.KEY_DOWN:
             if selected_index < len(things_to_display) - 1:
                 selected_index += 1
-                if selected_index >= end_index:
-                    end_index = min(num_items, selected_index + 1)
-                    start_index = max(0, end_index - page_size)
+                needs_render = True
         elif key == curses.KEY_ENTER or key in [10, 13]:
             # Access Thing object
             selected_thing: Thing = things_to_display[selected_index][0]
             selected_thing.set_keep(not selected_thing.get_keep())
+            needs_render = True
         elif key == ord('s'):
             if confirm_action("save"):
                 save_selections(root, output_path)
                 generate_massive_file(
                     output_path, output_path.replace(".txt", "_massive.txt"))
+            needs_render = True  # The prompt cleared the screen
         elif key == ord('q') or key == ord('Q'):
             if confirm_action("quit"):
                 break
+            needs_render = True  # The prompt cleared the screen
         elif key == ord(' '):  # Space bar toggles expansion/collapse
             # Access Thing object
             selected_thing = things_to_display[selected_index][0]
             if selected_thing.is_directory():
-                if selected_thing.get_path() in expanded_dirs:
-                    expanded_dirs.remove(selected_thing.get_path())
+                if selected_thing in expanded_dirs:
+                    expanded_dirs.remove(selected_thing)
                 else:
-                    expanded_dirs.add(selected_thing.get_path())
-        try:
-            render()
-        except curses.error:
-            pass
+                    expanded_dirs.add(selected_thing)
+                invalidate_visible_things()
+                needs_render = True
+        elif key == curses.KEY_RESIZE:
+            full_redraw = True
+            needs_render = True
 
 
 def save_selections(root: Thing, output_path: str):
+    """Write the path of every kept thing below root to output_path, one per line, in tree order."""
     # Clear the file if root
-    if root.get_parent() is None:
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write('')
-
-    for i, thing in enumerate(root.get_children()):
-        if thing.get_keep():
-            with open(output_path, 'a', encoding='utf-8') as f:
+    mode = 'w' if root.get_parent() is None else 'a'
+
+    with open(output_path, mode, encoding='utf-8') as f:
+        # Explicit stack instead of recursion; children are pushed reversed to keep their order
+        stack = list(reversed(root.get_children()))
+        while stack:
+            thing = stack.pop()
+            if thing.get_keep():
                 f.write(f"{thing.get_path()}\n")
-        if thing.get_children():
-            save_selections(thing, output_path)
+            # Everything below an unkept directory is unkept too
+            if thing.get_keep() is not False:
+                stack.extend(reversed(thing.get_children()))
 
 
-def apply_input_preferences(root: Thing, input_preferences: List[str]):
+def apply_input_preferences(root: Thing, input_preferences: Set[str]):
     """
     Apply the input preferences to the Thing tree, setting the keep status
     based on whether the path is in the input preferences.
     """
+    # Pruning below relies on os.path.dirname of a preferred path naming the
+    # path of the Thing that contains it. Both sides go through
+    # os.path.normpath so spellings like './a/b', 'a/b' and 'a//b' agree, and
+    # the root is always descended in case it was typed differently ('proj/').
+    preferred = {os.path.normpath(path) for path in input_preferences}
+
+    # Directories with a preferred path somewhere below them
+    preferred_parents = set()
+    for path in preferred:
+        parent = os.path.dirname(path)
+        while parent and parent not in preferred_parents:
+            preferred_parents.add(parent)
+            parent = os.path.dirname(parent)
 
     def update_keep_status(thing: Thing):
         # Set keep status based on whether this thing's path is in input_preferences
-        path = thing.get_path()
-        if path in input_preferences:
+        path = os.path.normpath(thing.get_path())
+        if path in preferred:
             thing.set_keep(True)
         else:
             thing.set_keep(False)
 
-        # Recursively update children
-        for child in thing.get_children():
-            update_keep_status(child)
+        # Recursively update children; set_keep(False) already cleared the
+        # subtree, so only descend where a child may need a different value
+        if thing is root or path in preferred or path in preferred_parents:
+            for child in thing.get_children():
+                update_keep_status(child)
 
     # Start from the root and update the entire tree
     update_keep_status(root)
@@ -266,9 +357,15 @@ def main():
     if args.input:
         input_preferences = load_input_preferences(args.input)
     else:
-        input_preferences = []
+        input_preferences = set()
+
+    # Drop trailing separators ('proj/' -> 'proj') so the root is spelled like the
+    # prefix of its children's paths. Only strip after the anchor: '/', 'C:\'
+    # and 'C:/' name a root, while 'C:' would mean the current directory on C.
+    drive, rest = os.path.splitdrive(args.root_path)
+    root_path = drive + (rest.rstrip(os.sep + (os.altsep or '')) or rest[:1])
 
-    root_thing = Thing('.', file_types=file_ext, ignore=[])
+    root_thing = Thing(root_path, file_types=file_ext, ignore=[])
 
     # Apply input preferences before starting the curses app
     apply_input_preferences(root_thing, input_preferences)
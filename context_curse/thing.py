@@ -1,23 +1,31 @@
 import enum
 import os
-from typing import List
+from typing import FrozenSet, Iterable, List, Tuple
 
 
-def get_paths(root: str, file_types: List[str], ignore: List[str] = []) -> List[str]:
-    """Search through the root directory and return a list of all files with the given file types."""
-    if not file_types:
-        file_types = ['']
+def get_ext(name: str) -> str:
+    """Return the extension of a file name without the leading dot, or '' if it has none."""
+    dot = name.rfind('.')
+    return name[dot + 1:] if dot > 0 else ''
+
+
+def get_paths(root: str, file_types: Iterable[str], ignore: List[str] = []) -> List[Tuple[str, bool, bool]]:
+    """Search through the root directory and return (path, is_dir, is_link) for all directories and files with the given file types.
+
+    Symlinks are followed, so a link to a directory counts as a directory."""
+    # frozenset() of a frozenset returns it unchanged, so Things can pass theirs straight through
+    wanted = frozenset(file_types) if file_types else None
 
     paths = []
-    for item in os.listdir(root):
-        if item in ignore:
-            continue
-        full_path = os.path.join(root, item)
-        if os.path.isdir(full_path):
-            paths.append(full_path)
-        else:
-            if (file_ext := os.path.splitext(item)[-1].lstrip('.')) in file_types or file_types == ['']:
-                paths.append(full_path)
+    with os.scandir(root) as entries:
+        for entry in entries:
+            name = entry.name
+            if name in ignore:
+                continue
+            # Only symlinks cost a stat here; other entries are typed by scandir
+            is_dir = entry.is_dir()
+            if is_dir or wanted is None or get_ext(name) in wanted:
+                paths.append((entry.path, is_dir, entry.is_symlink()))
     return paths
 
 
@@ -27,24 +35,30 @@ class ThingType(enum.Enum):
 
 
 class Thing:
-    def __init__(self, path: str, parent: 'Thing' = None, file_types: List[str] = [], ignore: List[str] = []):
+    def __init__(self, path: str, parent: 'Thing' = None, file_types: Iterable[str] = [], ignore: List[str] = [], is_dir: bool = None, is_link: bool = False):
         self.__path: str = path
         self.__parent: Thing = parent
         self.__children: List[Thing] = []
         self.__selected: bool = False
         self.__keep: bool = False
-
-        if self.is_directory():
+        self.__kept_children_count: int = 0  # Children whose keep is True
+        # Built once at the root and shared by every Thing below it
+        self.__file_types: FrozenSet[str] = frozenset(file_types)
+        # Stat at most once; children get their type from the parent's scandir entry.
+        self.__is_dir: bool = os.path.isdir(
+            path) if is_dir is None else is_dir
+
+        if self.__is_dir:
             self.__type = ThingType.DIRECTORY
-            for child_path in get_paths(self.__path, file_types, ignore):
-                self.__children.append(
-                    Thing(child_path, self, file_types, ignore))
+            # Children are only scanned the first time get_children() is called
+            self.__pending: bool = True
+            self.__ignore: List[str] = ignore
+            self.__is_link: bool = is_link
+            self.__real_path: str = None  # Resolved on demand by __get_real_path
         else:
             self.__type = ThingType.FILE
-            if os.path.splitext(self.__path)[-1].lstrip('.') in file_types or file_types == ['']:
-                self.__hidden: bool = False
-            else:
-                self.__hidden: bool = True
+            self.__hidden: bool = get_ext(
+                os.path.basename(path)) not in self.__file_types
 
     def get_path(self) -> str:
         return self.__path
@@ -56,6 +70,8 @@ class Thing:
         return self.__parent
 
     def get_children(self) -> List['Thing']:
+        if self.__is_dir and self.__pending:
+            self.__load_children()
         return self.__children
 
     def get_selected(self) -> bool:
@@ -70,12 +86,12 @@ class Thing:
     def get_children_keep(self) -> bool:
         if not self.__children:
             return self.__keep
-        return all([child.get_keep() for child in self.__children])
+        return self.__kept_children_count == len(self.__children)
 
     def get_children_not_keep(self) -> bool:
         if not self.__children:
             return not self.__keep
-        return all([not child.get_keep() for child in self.__children])
+        return self.__kept_children_count == 0
 
     def set_selected(self, selected: bool):
         self.__selected = selected
@@ -83,39 +99,101 @@ class Thing:
     def set_hidden(self, hidden: bool):
         self.__hidden = hidden
 
+    def __load_children(self):
+        """ Scan the directory and create its children, which inherit this item's keep value."""
+        self.__pending = False
+        try:
+            paths = get_paths(self.__path, self.__file_types, self.__ignore)
+        except OSError:
+            # Removed or unreadable since startup; show it as empty instead of ending the session
+            paths = []
+        for child_path, child_is_dir, child_is_link in paths:
+            # A directory link back into its own ancestry would nest forever
+            if child_is_dir and child_is_link and self.__leads_to_ancestor(child_path):
+                continue
+            child = Thing(child_path, self, self.__file_types,
+                          self.__ignore, child_is_dir, child_is_link)
+            child.__keep = self.__keep
+            self.__children.append(child)
+        if self.__keep:
+            self.__kept_children_count = len(self.__children)
+
+    def __get_real_path(self) -> str:
+        """ Return the resolved path of this directory; only the root and symlinks need os.path.realpath."""
+        if self.__real_path is None:
+            if self.__parent is None or self.__is_link:
+                self.__real_path = os.path.realpath(self.__path)
+            else:
+                self.__real_path = os.path.join(
+                    self.__parent.__get_real_path(), os.path.basename(self.__path))
+        return self.__real_path
+
+    def __leads_to_ancestor(self, path: str) -> bool:
+        """ Check whether path resolves to this directory or one of its ancestors."""
+        real_path = os.path.realpath(path)
+        thing = self
+        while thing:
+            if thing.__get_real_path() == real_path:
+                return True
+            thing = thing.__parent
+        return False
+
+    def __assign_keep(self, keep: bool):
+        """ Set the keep value and update the parent's count of kept children."""
+        if self.__parent and bool(keep) != bool(self.__keep):
+            self.__parent.__kept_children_count += 1 if keep else -1
+        self.__keep = keep
+
     def __set_keep_update_children(self, keep: bool):
         """ Recursively set the keep value for this item and all its children."""
-        self.__keep = keep
-        if self.__type == ThingType.DIRECTORY:
+        self.__assign_keep(keep)
+        if self.__is_dir:
             for child in self.__children:
                 child.__set_keep_update_children(keep)
 
     def __check_and_update_parent(self):
         """ Update the parent's keep value based on the children's states."""
         if self.__parent:
-            all_kept = all(child.get_keep()
-                           for child in self.__parent.get_children())
-            none_kept = all(child.get_keep()
-                            is False for child in self.__parent.get_children())
-
-            if all_kept:
-                self.__parent.__keep = True
-            elif none_kept:
-                self.__parent.__keep = False
+            # One pass over the siblings, stopping as soon as the result is mixed
+            saw_kept = saw_unkept = False
+            siblings = self.__parent.get_children()
+            for child in siblings:
+                child_keep = child.get_keep()
+                if child_keep:
+                    saw_kept = True
+                elif child_keep is False:
+                    saw_unkept = True
+                else:  # A mixed child makes the parent mixed
+                    saw_kept = saw_unkept = True
+                if saw_kept and saw_unkept:
+                    break
+
+            if not saw_unkept:
+                keep = True
+            elif not saw_kept:
+                keep = False
             else:
-                self.__parent.__keep = None
+                keep = None
+
+            # Ancestors only depend on the parent's state, so stop if it is unchanged
+            if keep is self.__parent.__keep:
+                return
+            self.__parent.__assign_keep(keep)
 
             # Recursively update the parent's keep state
             self.__parent.__check_and_update_parent()
 
     def set_keep(self, keep: bool):
         """Set the keep value and update children and parent accordingly."""
-        self.__keep = keep
         self.__set_keep_update_children(keep)
         self.__check_and_update_parent()
         
     def is_directory(self) -> bool:
-        return os.path.isdir(self.__path)
+        """Return whether this is a directory, as determined when the Thing was created.
+
+        The result is cached and not re-checked against the file system, so it
+        goes stale if the path changes type during the session."""
+        return self.__is_dir
 
     def toggle_visibility(self):
         self.__hidden = not self.__hidden
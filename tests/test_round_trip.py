@@ -0,0 +1,81 @@
+import ntpath
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from context_curse import __main__ as app
+
+
+class RoundTripTest(unittest.TestCase):
+    """Saving a selection and loading it back with -i must reproduce it."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+        os.makedirs(os.path.join('proj', 'a', 'b'))
+        for path in (('proj', 'a', 'b', 'x.py'), ('proj', 'a', 'y.py'), ('proj', 'z.py')):
+            with open(os.path.join(*path), 'w', encoding='utf-8') as f:
+                f.write('pass\n')
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def run_main(self, *args, select=None):
+        """Run main() with curses replaced by a callback that keeps `select` and saves."""
+        def fake_wrapper(_, root, output_path):
+            if select is not None:
+                thing = root
+                for name in select:
+                    thing = next(child for child in thing.get_children()
+                                 if os.path.basename(child.get_path()) == name)
+                thing.set_keep(True)
+            app.save_selections(root, output_path)
+
+        argv = ['context_curse', *args]
+        with mock.patch.object(sys, 'argv', argv), \
+                mock.patch.object(app.curses, 'wrapper', fake_wrapper):
+            app.main()
+        with open('prefs.txt', encoding='utf-8') as f:
+            return f.read()
+
+    def test_round_trip(self):
+        for root_path in ('proj', 'proj/', './proj/'):
+            with self.subTest(root_path=root_path):
+                saved = self.run_main('-r', root_path, '-o', 'prefs.txt',
+                                      select=('a', 'b'))
+                self.assertIn('x.py', saved)
+                reloaded = self.run_main('-r', root_path, '-i', 'prefs.txt',
+                                         '-o', 'prefs.txt')
+                self.assertEqual(saved, reloaded)
+
+    def root_path_for(self, root_arg, os_module=os):
+        """Run main() with -r root_arg and return the path of the root Thing it browses."""
+        roots = []
+        argv = ['context_curse', '-r', root_arg, '-o', 'prefs.txt']
+        with mock.patch.object(sys, 'argv', argv), \
+                mock.patch.object(app, 'os', os_module), \
+                mock.patch.object(app.curses, 'wrapper',
+                                  lambda _, root, __: roots.append(root.get_path())):
+            app.main()
+        return roots[0]
+
+    def test_root_path_keeps_anchor(self):
+        self.assertEqual(self.root_path_for('/'), '/')
+        self.assertEqual(self.root_path_for('proj//'), 'proj')
+
+        # Windows drive roots; ntpath stands in for os.path on any platform
+        windows_os = SimpleNamespace(path=ntpath, sep='\\', altsep='/')
+        for root_arg, expected in (('C:\\', 'C:\\'), ('C:/', 'C:/'),
+                                   ('C:\\proj\\', 'C:\\proj'), ('C:', 'C:')):
+            with self.subTest(root_arg=root_arg):
+                self.assertEqual(
+                    self.root_path_for(root_arg, windows_os), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()